@@ -0,0 +1 @@
+Added a ``python -m pyemd`` command-line tool for bulk EMD jobs, with pairwise, one-vs-many and paired modes, ``.npy``/``.npz``/CSV input, streaming ``.npy``/CSV output, multiple worker processes, and throughput statistics.
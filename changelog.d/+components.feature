@@ -0,0 +1 @@
+Added ``distance_matrix_components()`` and a ``components`` keyword argument to ``emd()`` and ``emd_with_flow()``. Distance matrices that connect groups of bins only through their maximum entry are solved exactly as independent per-group problems plus a cross-group term.
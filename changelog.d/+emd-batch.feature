@@ -0,0 +1 @@
+Added ``emd_batch()``, which computes the EMD between corresponding rows of two batches of histograms with vectorized validation, extra-mass penalties and same-bin cancellation, calling the solver only for pairs with residual mass. Same-bin cancellation in ``emd()`` and ``emd_with_flow()`` is now vectorized, and ``python -m pyemd`` uses ``emd_batch()`` for each chunk.
@@ -0,0 +1 @@
+Added ``emd_below()``, which decides whether the EMD is at most a given cutoff, checking cheap lower and upper bounds before falling back to an exact solve.
@@ -0,0 +1 @@
+Added ``emd_with_potentials()``, which also returns the optimal dual potentials, and ``emd_dual_bound()``, which uses them to compute vectorized lower bounds on the EMD between other histogram pairs.
@@ -0,0 +1 @@
+Added ``emd_samples_nd()`` for multi-dimensional samples, with a fast sliced-Wasserstein approximation (``method="sliced"``) that returns a variance estimate, and an exact method.
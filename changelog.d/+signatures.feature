@@ -0,0 +1 @@
+Added ``emd_signatures()`` and ``emd_signatures_with_flow()`` for computing the EMD between signatures (weights and features) with different lengths and supports, without padding them into a shared bin space.
@@ -40,6 +40,13 @@ You can also calculate the EMD directly from two arrays of observations:
     >>> emd_samples(first_array, second_array, bins=2)
     0.5
 
+Signatures with different supports can be compared without padding them into a
+shared bin space:
+
+    >>> from pyemd import emd_signatures
+    >>> emd_signatures([0.5, 0.5], [[0.0], [1.0]], [1.0], [[2.0]])
+    1.5
+
 
 Limitations and Caveats
 ~~~~~~~~~~~~~~~~~~~~~~~
@@ -61,9 +68,33 @@ Credit
 :license: See the LICENSE file.
 """
 
-from .emd import emd, emd_with_flow, emd_samples
-
-__all__ = ["emd", "emd_with_flow", "emd_samples"]
+from .emd import (
+    emd,
+    emd_with_flow,
+    emd_batch,
+    emd_with_potentials,
+    emd_dual_bound,
+    emd_samples,
+    emd_samples_nd,
+    emd_below,
+    distance_matrix_components,
+    emd_signatures,
+    emd_signatures_with_flow,
+)
+
+__all__ = [
+    "emd",
+    "emd_with_flow",
+    "emd_batch",
+    "emd_with_potentials",
+    "emd_dual_bound",
+    "emd_samples",
+    "emd_samples_nd",
+    "emd_below",
+    "distance_matrix_components",
+    "emd_signatures",
+    "emd_signatures_with_flow",
+]
 
 try:
     from importlib.metadata import version, PackageNotFoundError
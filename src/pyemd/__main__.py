@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# __main__.py
+
+"""Command-line tool for computing many EMDs in one batch.
+
+Inputs are 2D arrays stored as ``.npy``, ``.npz`` or ``.csv`` files, with one
+histogram (or one array of samples) per row. Examples::
+
+    # All pairs of rows of first.npy and second.npy
+    python -m pyemd --distance-matrix M.npy first.npy second.npy -o out.npy
+
+    # One histogram against every row of many.csv, using 4 processes
+    python -m pyemd --mode one-vs-many --distance-matrix M.npy \\
+        query.npy many.csv -o out.csv --workers 4
+
+    # Row i of first.csv against row i of second.csv, from raw samples
+    python -m pyemd --mode paired --samples first.csv second.csv
+
+Results are written in chunks as they are computed. ``.npy`` output has shape
+``(N1, N2)`` in pairwise mode and ``(N,)`` otherwise; CSV output (the default,
+to stdout) has one ``first,second,emd`` line per pair of row indices.
+Throughput statistics are printed to stderr at the end.
+"""
+
+import argparse
+import functools
+import multiprocessing
+import os
+import sys
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import numpy as np
+
+from .emd import (
+    DEFAULT_EXTRA_MASS_PENALTY,
+    _validate_emd_batch_input,
+    emd_batch,
+    emd_samples,
+)
+
+
+MODES = ("pairwise", "one-vs-many", "paired")
+
+# Set in each worker process by `_init_worker()`
+_job = None
+
+
+def _load(path: str, key: str | None = None) -> np.ndarray:
+    """Load a 2D array from a ``.npy``, ``.npz`` or ``.csv`` file."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".npy":
+        array = np.load(path, mmap_mode="r")
+    elif suffix == ".npz":
+        with np.load(path) as archive:
+            name = key if key is not None else archive.files[0]
+            if name not in archive.files:
+                raise ValueError(f"No array named {name!r} in {path}")
+            array = archive[name]
+    elif suffix == ".csv":
+        array = np.genfromtxt(path, delimiter=",", ndmin=2)
+    else:
+        raise ValueError(f"Unsupported file type: {path}")
+    if array.ndim != 2:
+        raise ValueError(f"Expected a 2D array in {path}, got {array.ndim}D")
+    return array
+
+
+def _bins(value: str) -> int | str:
+    """Parse the ``--bins`` option, which is either an integer or a name."""
+    return int(value) if value.isdigit() else value
+
+
+def _emd_samples_batch(
+    first_arrays: np.ndarray, second_arrays: np.ndarray, **kwargs
+) -> np.ndarray:
+    """Return ``emd_samples()`` between corresponding rows, ignoring NaN padding."""
+    return np.array(
+        [
+            emd_samples(first[~np.isnan(first)], second[~np.isnan(second)], **kwargs)
+            for first, second in zip(first_arrays, second_arrays)
+        ],
+        dtype=np.float64,
+    )
+
+
+def _pair_indices(
+    mode: str, start: int, stop: int, n_second: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the row indices of the pairs with flat indices in [start, stop)."""
+    flat = np.arange(start, stop)
+    if mode == "pairwise":
+        return flat // n_second, flat % n_second
+    if mode == "one-vs-many":
+        return np.zeros_like(flat), flat
+    return flat, flat
+
+
+def _init_worker(job: tuple) -> None:
+    global _job
+    _job = job
+
+
+def _compute_chunk(bounds: tuple[int, int]) -> tuple[int, int, np.ndarray]:
+    """Compute the EMDs for one chunk of pairs."""
+    start, stop = bounds
+    first, second, mode, distance = _job
+    rows, cols = _pair_indices(mode, start, stop, len(second))
+    return start, stop, distance(first[rows], second[cols])
+
+
+def _chunks(total: int, chunk_size: int) -> Iterator[tuple[int, int]]:
+    for start in range(0, total, chunk_size):
+        yield start, min(start + chunk_size, total)
+
+
+def _run(
+    job: tuple, total: int, chunk_size: int, workers: int
+) -> Iterator[tuple[int, int, np.ndarray]]:
+    """Yield computed chunks in order, in this process or in a worker pool."""
+    if workers == 1:
+        _init_worker(job)
+        yield from map(_compute_chunk, _chunks(total, chunk_size))
+        return
+    with multiprocessing.Pool(workers, _init_worker, (job,)) as pool:
+        yield from pool.imap(_compute_chunk, _chunks(total, chunk_size))
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m pyemd",
+        description="Compute the EMD between many histograms or sample arrays.",
+    )
+    parser.add_argument("first", help="rows of histograms or samples")
+    parser.add_argument(
+        "second",
+        nargs="?",
+        help="rows of histograms or samples (pairwise mode defaults to FIRST)",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=MODES,
+        default="pairwise",
+        help="every row of FIRST against every row of SECOND (pairwise), the "
+        "single row of FIRST against every row of SECOND (one-vs-many), or "
+        "row i of FIRST against row i of SECOND (paired)",
+    )
+    parser.add_argument(
+        "-d", "--distance-matrix", help="ground distance matrix for histograms"
+    )
+    parser.add_argument(
+        "--samples",
+        action="store_true",
+        help="treat rows as arrays of samples and use emd_samples(); CSV rows "
+        "can be padded with empty fields",
+    )
+    parser.add_argument(
+        "--extra-mass-penalty", type=float, default=DEFAULT_EXTRA_MASS_PENALTY
+    )
+    parser.add_argument(
+        "--bins", type=_bins, default="auto", help="bins for emd_samples()"
+    )
+    parser.add_argument(
+        "--not-normalized",
+        action="store_true",
+        help="treat sample histograms as counts in emd_samples()",
+    )
+    parser.add_argument(
+        "--key", help="array name to read from .npz FIRST and SECOND files"
+    )
+    parser.add_argument(
+        "--distance-matrix-key",
+        help="array name to read from an .npz distance matrix file",
+    )
+    parser.add_argument(
+        "-o", "--output", help="output .npy or .csv file (default: CSV to stdout)"
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="number of worker processes; 0 means one per CPU (default: 1)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="number of pairs per unit of work and per write (default: 1000)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    if args.samples == (args.distance_matrix is not None):
+        parser.error("exactly one of --distance-matrix and --samples is required")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    workers = args.workers or os.cpu_count() or 1
+    if workers < 1:
+        parser.error("--workers must be at least 0")
+
+    if args.second is None and args.mode != "pairwise":
+        parser.error(f"SECOND is required in {args.mode} mode")
+    try:
+        first = _load(args.first, args.key)
+        second = first if args.second is None else _load(args.second, args.key)
+        if not args.samples:
+            distance_matrix = np.asarray(
+                _load(args.distance_matrix, args.distance_matrix_key)
+            )
+            _validate_emd_batch_input(first[:1], second[:1], distance_matrix)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+    if args.mode == "pairwise":
+        shape = (len(first), len(second))
+    elif args.mode == "one-vs-many":
+        if len(first) != 1:
+            parser.error("FIRST must contain exactly one row in one-vs-many mode")
+        shape = (len(second),)
+    else:
+        if len(first) != len(second):
+            parser.error("FIRST and SECOND must have the same number of rows")
+        shape = (len(first),)
+
+    distance: Callable[[np.ndarray, np.ndarray], np.ndarray]
+    if args.samples:
+        distance = functools.partial(
+            _emd_samples_batch,
+            extra_mass_penalty=args.extra_mass_penalty,
+            normalized=not args.not_normalized,
+            bins=args.bins,
+        )
+    else:
+        distance = functools.partial(
+            emd_batch,
+            distance_matrix=distance_matrix,
+            extra_mass_penalty=args.extra_mass_penalty,
+        )
+
+    job = (first, second, args.mode, distance)
+    total = int(np.prod(shape))
+
+    if args.output is not None and args.output.lower().endswith(".npy"):
+        out = np.lib.format.open_memmap(
+            args.output, mode="w+", dtype=np.float64, shape=shape
+        )
+        flat_out = out.reshape(-1)
+        csv = None
+    else:
+        out = None
+        csv = sys.stdout if args.output is None else open(args.output, "w")
+        csv.write("first,second,emd\n")
+
+    start_time = time.perf_counter()
+    try:
+        for start, stop, values in _run(job, total, args.chunk_size, workers):
+            if out is not None:
+                flat_out[start:stop] = values
+            else:
+                rows, cols = _pair_indices(args.mode, start, stop, len(second))
+                for i, j, value in zip(rows, cols, values):
+                    csv.write(f"{i},{j},{float(value)!r}\n")
+    except ValueError as error:
+        parser.error(str(error))
+    finally:
+        if out is not None:
+            out.flush()
+            del flat_out, out
+        elif csv is not sys.stdout:
+            csv.close()
+    elapsed = time.perf_counter() - start_time
+
+    rate = total / elapsed if elapsed > 0 else float("inf")
+    print(
+        f"Computed {total} EMDs in {elapsed:.3f} s "
+        f"({rate:.1f} EMDs/s, {workers} worker{'s' if workers != 1 else ''})",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
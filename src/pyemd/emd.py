@@ -15,6 +15,22 @@ import ot.partial
 DEFAULT_EXTRA_MASS_PENALTY = -1.0
 
 
+def _preflow_same_bins_batch(
+    a: np.ndarray, b: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pre-flow mass within same bins for histograms of any shape.
+
+    Vectorized version of ``_preflow_same_bins()`` that works elementwise, so
+    it applies equally to a pair of 1D histograms or to B × N stacks of them.
+
+    Returns:
+        a_reduced, b_reduced: Modified histograms with same-bin mass removed
+        preflow_mass: Mass pre-flowed within each bin
+    """
+    preflow_mass = np.minimum(a, b)
+    return a - preflow_mass, b - preflow_mass, preflow_mass
+
+
 def _preflow_same_bins(
     a: np.ndarray, b: np.ndarray
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -28,21 +44,8 @@ def _preflow_same_bins(
         a_reduced, b_reduced: Modified histograms with same-bin mass removed
         preflow: Matrix of pre-flowed mass (diagonal only)
     """
-    a_reduced = a.copy()
-    b_reduced = b.copy()
-    n = len(a)
-    preflow = np.zeros((n, n))
-
-    for i in range(n):
-        if a_reduced[i] < b_reduced[i]:
-            preflow[i, i] = a_reduced[i]
-            b_reduced[i] -= a_reduced[i]
-            a_reduced[i] = 0
-        else:
-            preflow[i, i] = b_reduced[i]
-            a_reduced[i] -= b_reduced[i]
-            b_reduced[i] = 0
-
+    a_reduced, b_reduced, preflow_mass = _preflow_same_bins_batch(a, b)
+    preflow = np.diag(preflow_mass.astype(np.float64))
     return a_reduced, b_reduced, preflow
 
 
@@ -64,11 +67,138 @@ def _validate_emd_input(
         raise ValueError("Histogram lengths must be equal")
 
 
+def _validate_emd_batch_input(
+    first_histograms: np.ndarray,
+    second_histograms: np.ndarray,
+    distance_matrix: np.ndarray,
+) -> None:
+    """Validate batched EMD input."""
+    if first_histograms.ndim != 2 or second_histograms.ndim != 2:
+        raise ValueError("Histogram batches must be 2D arrays")
+    if first_histograms.shape[0] != second_histograms.shape[0]:
+        raise ValueError("Histogram batches must have the same number of rows")
+    if (
+        first_histograms.shape[1] > distance_matrix.shape[0]
+        or second_histograms.shape[1] > distance_matrix.shape[0]
+    ):
+        raise ValueError(
+            "Histogram lengths cannot be greater than the "
+            "number of rows or columns of the distance matrix"
+        )
+    if first_histograms.shape[1] != second_histograms.shape[1]:
+        raise ValueError("Histogram lengths must be equal")
+
+
+def distance_matrix_components(distance_matrix: np.ndarray) -> np.ndarray:
+    """Label the independent components of a ground distance matrix.
+
+    Two bins belong to the same component if they are connected by a chain of
+    distances strictly smaller than the maximum distance. Bins in different
+    components are therefore all at the maximum distance from each other (e.g.
+    "different category = maximum distance"), and the EMD decomposes into one
+    small transport problem per component plus a cross-component term.
+
+    Compute the labels once per distance matrix and pass them to ``emd()`` or
+    ``emd_with_flow()`` with the ``components`` keyword argument.
+
+    Arguments:
+        distance_matrix (np.ndarray): A square 2D array of np.float64.
+
+    Returns:
+        np.ndarray: An array of component labels ``0, 1, ...``, one per bin.
+
+    Raises:
+        ValueError: If the distance matrix isn't square.
+    """
+    M = np.asarray(distance_matrix)
+    if M.ndim != 2 or M.shape[0] != M.shape[1]:
+        raise ValueError("Distance matrix must be square")
+    n = M.shape[0]
+    linked = M < M.max()
+    linked |= linked.T
+
+    labels = np.full(n, -1)
+    label = 0
+    for start in range(n):
+        if labels[start] >= 0:
+            continue
+        labels[start] = label
+        frontier = np.array([start])
+        while frontier.size:
+            frontier = np.flatnonzero(linked[frontier].any(axis=0) & (labels < 0))
+            labels[frontier] = label
+        label += 1
+    return labels
+
+
+def _transport_by_components(
+    a_reduced: np.ndarray,
+    b_reduced: np.ndarray,
+    distance_matrix: np.ndarray,
+    components: np.ndarray,
+) -> np.ndarray:
+    """Solve the residual partial transport one component at a time.
+
+    Moving mass between components always costs the maximum distance, so it is
+    optimal to first move as much mass as possible within each component. The
+    leftover mass is then moved between components in any order, at the
+    maximum cost per unit, until ``min(sum(a), sum(b))`` units have moved.
+
+    Returns:
+        flow: The N × N transport matrix, equal in cost to the one returned by
+        ``ot.partial.partial_wasserstein()``.
+    """
+    n = len(a_reduced)
+    components = np.asarray(components)[:n]
+    flow = np.zeros((n, n))
+
+    for label in np.unique(components):
+        idx = np.flatnonzero(components == label)
+        a_k = a_reduced[idx]
+        b_k = b_reduced[idx]
+        m_k = min(a_k.sum(), b_k.sum())
+        if m_k > 0:
+            block = np.ix_(idx, idx)
+            flow[block] = ot.partial.partial_wasserstein(
+                a_k, b_k, distance_matrix[block], m=m_k
+            )
+
+    # Cross-component term: pair the leftover mass north-west-corner style
+    to_move = min(a_reduced.sum(), b_reduced.sum()) - flow.sum()
+    if to_move > 0:
+        left_a = np.clip(a_reduced - flow.sum(axis=1), 0, None)
+        left_b = np.clip(b_reduced - flow.sum(axis=0), 0, None)
+        hi_a = np.minimum(np.cumsum(left_a), to_move)
+        hi_b = np.minimum(np.cumsum(left_b), to_move)
+        lo_a = np.concatenate([[0.0], hi_a[:-1]])
+        lo_b = np.concatenate([[0.0], hi_b[:-1]])
+        overlap = np.minimum.outer(hi_a, hi_b) - np.maximum.outer(lo_a, lo_b)
+        flow += np.clip(overlap, 0, None)
+
+    return flow
+
+
+def _partial_transport(
+    a_reduced: np.ndarray,
+    b_reduced: np.ndarray,
+    distance_matrix: np.ndarray,
+    components: np.ndarray | None,
+) -> np.ndarray:
+    """Move exactly ``min(sum(a), sum(b))`` units at minimal cost."""
+    if components is None or np.unique(components).size == 1:
+        min_sum = min(a_reduced.sum(), b_reduced.sum())
+        return ot.partial.partial_wasserstein(
+            a_reduced, b_reduced, distance_matrix, m=min_sum
+        )
+    return _transport_by_components(a_reduced, b_reduced, distance_matrix, components)
+
+
 def emd(
     first_histogram: np.ndarray,
     second_histogram: np.ndarray,
     distance_matrix: np.ndarray,
     extra_mass_penalty: float = DEFAULT_EXTRA_MASS_PENALTY,
+    components: np.ndarray | None = None,
 ) -> float:
     """Return the EMD between two histograms using the given distance matrix.
 
@@ -93,6 +223,11 @@ def emd(
             then the resulting distance is not guaranteed to be a metric). The
             default value is -1, which means the maximum value in the distance
             matrix is used.
+        components (np.ndarray): Component labels of the distance matrix, as
+            returned by ``distance_matrix_components()``. If given, the
+            transport problem is solved independently within each component,
+            which is exact and much faster when bins in different components
+            are all at the maximum distance from each other.
 
     Returns:
         float: The EMD value.
@@ -124,12 +259,9 @@ def emd(
         return float(extra_mass * extra_mass_penalty)
 
     # Compute transport for remaining mass using partial transport
-    # This matches C++ behavior: transport min_sum units from original distributions
-    min_sum = min(sum_a, sum_b)
-
-    # Use partial transport to move exactly min_sum units
-    # POT's partial_wasserstein transports exactly m mass
-    G = ot.partial.partial_wasserstein(a_reduced, b_reduced, M, m=min_sum)
+    # This matches C++ behavior: transport min(sum_a, sum_b) units from original
+    # distributions
+    G = _partial_transport(a_reduced, b_reduced, M, components)
     transport_cost = np.sum(G * M)
 
     # Add penalty for extra mass
@@ -141,6 +273,7 @@ def emd_with_flow(
     second_histogram: np.ndarray,
     distance_matrix: np.ndarray,
     extra_mass_penalty: float = DEFAULT_EXTRA_MASS_PENALTY,
+    components: np.ndarray | None = None,
 ) -> tuple[float, list[list[float]]]:
     """Return the EMD and flow between two histograms using the given distance matrix.
 
@@ -165,6 +298,11 @@ def emd_with_flow(
             then the resulting distance is not guaranteed to be a metric). The
             default value is -1, which means the maximum value in the distance
             matrix is used.
+        components (np.ndarray): Component labels of the distance matrix, as
+            returned by ``distance_matrix_components()``. If given, the
+            transport problem is solved independently within each component,
+            which is exact and much faster when bins in different components
+            are all at the maximum distance from each other.
 
     Returns:
         (tuple(float, list(list(float)))): The EMD value and the associated
@@ -195,9 +333,8 @@ def emd_with_flow(
     if sum_a == 0 or sum_b == 0:
         return float(extra_mass * extra_mass_penalty), preflow.tolist()
 
-    # Use partial transport to move exactly min_sum units
-    min_sum = min(sum_a, sum_b)
-    G = ot.partial.partial_wasserstein(a_reduced, b_reduced, M, m=min_sum)
+    # Use partial transport to move exactly min(sum_a, sum_b) units
+    G = _partial_transport(a_reduced, b_reduced, M, components)
     transport_cost = np.sum(G * M)
 
     # Combine preflow and actual transport
@@ -207,6 +344,484 @@ def emd_with_flow(
     return total_cost, flow.tolist()
 
 
+def emd_batch(
+    first_histograms: np.ndarray,
+    second_histograms: np.ndarray,
+    distance_matrix: np.ndarray,
+    extra_mass_penalty: float = DEFAULT_EXTRA_MASS_PENALTY,
+    components: np.ndarray | None = None,
+) -> np.ndarray:
+    """Return the EMDs between corresponding rows of two batches of histograms.
+
+    Equivalent to calling ``emd()`` on each pair of rows, but validation, mass
+    sums, extra-mass penalties and same-bin cancellation are done once for the
+    whole batch. Only the pairs with mass left to transport after cancellation
+    are passed to the solver.
+
+    Arguments:
+        first_histograms (np.ndarray): A B × N array of np.float64.
+        second_histograms (np.ndarray): A B × N array of np.float64.
+        distance_matrix (np.ndarray): A 2D array of np.float64, of size at least
+            N × N. It must represent a metric; there is no warning if it
+            doesn't.
+
+    Keyword Arguments:
+        extra_mass_penalty (float): The penalty for extra mass. Same as for
+            ``emd()``.
+        components (np.ndarray): Component labels of the distance matrix. Same
+            as for ``emd()``.
+
+    Returns:
+        np.ndarray: The B EMD values.
+
+    Raises:
+        ValueError: If the batches aren't 2D arrays with the same shape, or if
+        the histograms are longer than the number of rows or columns of the
+        distance matrix.
+    """
+    a = np.asarray(first_histograms)
+    b = np.asarray(second_histograms)
+    M = np.asarray(distance_matrix)
+
+    _validate_emd_batch_input(a, b, M)
+
+    if extra_mass_penalty == -1.0:
+        extra_mass_penalty = M.max()
+
+    # Pre-flow: cancel mass within same bins, for all pairs at once
+    a_reduced, b_reduced, _ = _preflow_same_bins_batch(a, b)
+
+    sum_a = a_reduced.sum(axis=1)
+    sum_b = b_reduced.sum(axis=1)
+    result = np.abs(a.sum(axis=1) - b.sum(axis=1)) * extra_mass_penalty
+    result = result.astype(np.float64)
+
+    # Pairs where all mass was pre-flowed need no transport
+    for i in np.flatnonzero((sum_a != 0) & (sum_b != 0)):
+        G = _partial_transport(a_reduced[i], b_reduced[i], M, components)
+        result[i] += np.sum(G * M)
+
+    return result
+
+
+def _with_extra_mass_bin(
+    a: np.ndarray, b: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Append an extra mass bin to each histogram so that their masses match.
+
+    Works on the last axis, so it applies to single histograms and to stacks.
+    """
+    sum_a = a.sum(axis=-1, keepdims=True)
+    sum_b = b.sum(axis=-1, keepdims=True)
+    a_hat = np.concatenate([a, np.maximum(sum_b - sum_a, 0)], axis=-1)
+    b_hat = np.concatenate([b, np.maximum(sum_a - sum_b, 0)], axis=-1)
+    return a_hat, b_hat
+
+
+def emd_with_potentials(
+    first_histogram: np.ndarray,
+    second_histogram: np.ndarray,
+    distance_matrix: np.ndarray,
+    extra_mass_penalty: float = DEFAULT_EXTRA_MASS_PENALTY,
+) -> tuple[float, list[list[float]], np.ndarray, np.ndarray]:
+    """Return the EMD, flow and optimal dual potentials between two histograms.
+
+    The EMD with extra mass penalty is a balanced transport problem once an
+    extra mass bin is appended to each histogram: the lighter histogram gets
+    the missing mass in its extra bin, and moving mass to or from an extra bin
+    costs ``extra_mass_penalty``. The dual potentials returned here are those
+    of this augmented problem, so they have length N + 1, the last entry being
+    the potential of the extra mass bin.
+
+    Dual potentials are feasible for any pair of histograms under the same
+    distance matrix and extra mass penalty, so they give cheap lower bounds on
+    other EMDs; see ``emd_dual_bound()``.
+
+    Arguments:
+        first_histogram (np.ndarray): A 1D array of type np.float64 of length N.
+        second_histogram (np.ndarray): A 1D array of np.float64 of length N.
+        distance_matrix (np.ndarray): A 2D array of np.float64, of size at least
+            N × N. It must represent a metric; there is no warning if it
+            doesn't.
+
+    Keyword Arguments:
+        extra_mass_penalty (float): The penalty for extra mass. Same as for
+            ``emd()``.
+
+    Returns:
+        (tuple(float, list(list(float)), np.ndarray, np.ndarray)): The EMD
+        value, the associated minimum-cost flow (without the extra mass bins),
+        and the dual potentials of the first and second histograms.
+
+    Raises:
+        ValueError: If the length of either histogram is greater than the number
+        of rows or columns of the distance matrix, or if the histograms aren't
+        the same length.
+    """
+    a = np.asarray(first_histogram, dtype=np.float64)
+    b = np.asarray(second_histogram, dtype=np.float64)
+    M = np.asarray(distance_matrix)
+
+    _validate_emd_input(a, b, M)
+
+    if extra_mass_penalty == -1.0:
+        extra_mass_penalty = M.max()
+
+    n = len(a)
+    M_hat = np.full((n + 1, n + 1), float(extra_mass_penalty))
+    M_hat[:n, :n] = M[:n, :n]
+    M_hat[n, n] = 0.0
+    a_hat, b_hat = _with_extra_mass_bin(a, b)
+
+    # Edge case: no mass at all; zero potentials are feasible
+    if a_hat.sum() == 0:
+        return 0.0, np.zeros((n, n)).tolist(), np.zeros(n + 1), np.zeros(n + 1)
+
+    G, log = ot.emd(a_hat, b_hat, M_hat, log=True)
+    return float(np.sum(G * M_hat)), G[:n, :n].tolist(), log["u"], log["v"]
+
+
+def emd_dual_bound(
+    first_histograms: np.ndarray,
+    second_histograms: np.ndarray,
+    first_potential: np.ndarray,
+    second_potential: np.ndarray,
+) -> float | np.ndarray:
+    """Return a lower bound on the EMD from dual potentials.
+
+    The bound holds for any pair of histograms, as long as the potentials come
+    from ``emd_with_potentials()`` with the same distance matrix and extra mass
+    penalty. It costs O(N) per pair, so it can be used to discard candidates
+    before computing exact EMDs. It is exact for the pair the potentials were
+    computed from.
+
+    Arguments:
+        first_histograms (np.ndarray): A 1D array of length N, or a B × N
+            array of histograms.
+        second_histograms (np.ndarray): An array of the same shape as
+            ``first_histograms``.
+        first_potential (np.ndarray): The dual potential of the first
+            histogram, of length N + 1.
+        second_potential (np.ndarray): The dual potential of the second
+            histogram, of length N + 1.
+
+    Returns:
+        float or np.ndarray: The lower bound, or the B lower bounds.
+
+    Raises:
+        ValueError: If the histograms don't have the same shape, or if their
+        length doesn't match the potentials.
+    """
+    a = np.asarray(first_histograms, dtype=np.float64)
+    b = np.asarray(second_histograms, dtype=np.float64)
+    u = np.asarray(first_potential, dtype=np.float64)
+    v = np.asarray(second_potential, dtype=np.float64)
+
+    if a.shape != b.shape:
+        raise ValueError("Histograms must have the same shape")
+    if not (a.shape[-1] + 1 == u.shape[0] == v.shape[0]):
+        raise ValueError(
+            "Potentials must have one more entry than the histograms have bins"
+        )
+
+    a_hat, b_hat = _with_extra_mass_bin(a, b)
+    bound = a_hat @ u + b_hat @ v
+    return float(bound) if bound.ndim == 0 else bound
+
+
+# Bounds only settle ``emd_below()`` when they clear the cutoff by this relative
+# margin, since they are not computed in the same order as the exact cost
+_BOUND_RELATIVE_TOLERANCE = 1e-12
+
+
+def _transport_lower_bound(a_s: np.ndarray, b_s: np.ndarray, C: np.ndarray) -> float:
+    """Return a lower bound on the cost of the residual transport.
+
+    ``a_s`` and ``b_s`` are the residual masses on the (disjoint) supports of
+    the histograms reduced by ``_preflow_same_bins()``, and ``C`` the distances
+    between those supports. Each unit of the fully-transported side is sent to
+    its nearest bin on the other side, ignoring capacities.
+    """
+    sum_a = a_s.sum()
+    sum_b = b_s.sum()
+    lower = 0.0
+    if sum_a <= sum_b:
+        lower = max(lower, float(a_s @ C.min(axis=1)))
+    if sum_b <= sum_a:
+        lower = max(lower, float(b_s @ C.min(axis=0)))
+    return lower
+
+
+def _transport_upper_bound(a_s: np.ndarray, b_s: np.ndarray, C: np.ndarray) -> float:
+    """Return the cost of a feasible residual flow, an upper bound on the cost.
+
+    Takes the same arguments as ``_transport_lower_bound()``. The flow fills the
+    sinks in order with the north-west-corner rule, with sources ordered by
+    their nearest sink so that most mass lands close to where it would go.
+    """
+    to_move = min(a_s.sum(), b_s.sum())
+    order = np.argsort(C.argmin(axis=1), kind="stable")
+    a_s = a_s[order]
+    C = C[order]
+    hi_a = np.minimum(np.cumsum(a_s), to_move)
+    hi_b = np.minimum(np.cumsum(b_s), to_move)
+    lo_a = np.concatenate([[0.0], hi_a[:-1]])
+    lo_b = np.concatenate([[0.0], hi_b[:-1]])
+    flow = np.minimum.outer(hi_a, hi_b) - np.maximum.outer(lo_a, lo_b)
+    return float(np.sum(np.clip(flow, 0, None) * C))
+
+
+def emd_below(
+    first_histogram: np.ndarray,
+    second_histogram: np.ndarray,
+    distance_matrix: np.ndarray,
+    max_distance: float,
+    extra_mass_penalty: float = DEFAULT_EXTRA_MASS_PENALTY,
+) -> bool:
+    """Return whether the EMD between two histograms is at most ``max_distance``.
+
+    This gives the same answer as ``emd(...) <= max_distance``, but cheap lower
+    and upper bounds on the EMD are checked first, and the exact transport
+    problem is only solved when they don't clear the cutoff by a small relative
+    margin. This makes it suitable for deduplication and range queries where
+    most pairs are clearly near or clearly far.
+
+    Arguments:
+        first_histogram (np.ndarray): A 1D array of type np.float64 of length N.
+        second_histogram (np.ndarray): A 1D array of np.float64 of length N.
+        distance_matrix (np.ndarray): A 2D array of np.float64, of size at least
+            N × N. It must represent a metric; there is no warning if it
+            doesn't.
+        max_distance (float): The cutoff to compare the EMD against.
+
+    Keyword Arguments:
+        extra_mass_penalty (float): The penalty for extra mass. Same as for
+            ``emd()``.
+
+    Returns:
+        bool: Whether the EMD is less than or equal to ``max_distance``.
+
+    Raises:
+        ValueError: If the length of either histogram is greater than the number
+        of rows or columns of the distance matrix, or if the histograms aren't
+        the same length.
+    """
+    a = np.asarray(first_histogram)
+    b = np.asarray(second_histogram)
+    M = np.asarray(distance_matrix)
+
+    _validate_emd_input(a, b, M)
+
+    if extra_mass_penalty == -1.0:
+        extra_mass_penalty = M.max()
+
+    # Pre-flow: cancel mass within same bins
+    a_reduced, b_reduced, _ = _preflow_same_bins(a, b)
+
+    sum_a = a_reduced.sum()
+    sum_b = b_reduced.sum()
+    extra_mass_cost = abs(a.sum() - b.sum()) * extra_mass_penalty
+
+    # Edge case: all mass was pre-flowed, so the EMD is exactly the penalty
+    if sum_a == 0 or sum_b == 0:
+        return bool(extra_mass_cost <= max_distance)
+
+    # The penalty term alone may already exceed the cutoff
+    if extra_mass_cost > max_distance:
+        return False
+
+    margin = _BOUND_RELATIVE_TOLERANCE * abs(max_distance)
+    src = np.flatnonzero(a_reduced)
+    dst = np.flatnonzero(b_reduced)
+    a_s = a_reduced[src]
+    b_s = b_reduced[dst]
+    C = M[np.ix_(src, dst)]
+
+    # Cheapest checks first: nearest-bin lower bound, then the most expensive
+    # possible move for every unit, then a feasible flow
+    if extra_mass_cost + _transport_lower_bound(a_s, b_s, C) > max_distance + margin:
+        return False
+    if extra_mass_cost + min(sum_a, sum_b) * C.max() < max_distance - margin:
+        return True
+    if extra_mass_cost + _transport_upper_bound(a_s, b_s, C) < max_distance - margin:
+        return True
+
+    # Bounds are inconclusive: solve exactly
+    G = _partial_transport(a_reduced, b_reduced, M, None)
+    transport_cost = np.sum(G * M)
+    return bool(transport_cost + extra_mass_cost <= max_distance)
+
+
+def _as_features(features: np.ndarray) -> np.ndarray:
+    """Return signature features as a 2D array with one row per cluster."""
+    features = np.asarray(features, dtype=np.float64)
+    if features.ndim == 1:
+        features = features[:, np.newaxis]
+    return features
+
+
+def _validate_signature_input(
+    weights: np.ndarray, features: np.ndarray, name: str
+) -> None:
+    """Validate one side of a signature EMD input."""
+    if weights.size == 0:
+        raise ValueError(f"{name} signature cannot be empty")
+    if weights.ndim != 1:
+        raise ValueError(f"{name} weights must be a 1D array")
+    if features.ndim != 2:
+        raise ValueError(f"{name} features must be a 1D or 2D array")
+    if features.shape[0] != weights.shape[0]:
+        raise ValueError(
+            f"{name} signature must have one row of features per weight"
+        )
+
+
+def _signature_cost_matrix(
+    first_features: np.ndarray,
+    second_features: np.ndarray,
+    distance: str | Callable[[np.ndarray, np.ndarray], np.ndarray],
+) -> np.ndarray:
+    """Return the rectangular ground distance matrix between two supports."""
+    if first_features.shape[1] != second_features.shape[1]:
+        raise ValueError("Signature features must have the same dimension")
+    if distance == "euclidean":
+        diff = first_features[:, np.newaxis, :] - second_features[np.newaxis, :, :]
+        cost = np.sqrt(np.sum(diff**2, axis=-1))
+    else:
+        cost = distance(first_features, second_features)
+    cost = np.asarray(cost, dtype=np.float64)
+    if cost.shape != (first_features.shape[0], second_features.shape[0]):
+        raise ValueError(
+            "Distance matrix must have one row per first signature cluster and "
+            "one column per second signature cluster; check your `distance` "
+            "function."
+        )
+    return cost
+
+
+def _emd_signatures(
+    first_weights: ArrayLike,
+    first_features: ArrayLike,
+    second_weights: ArrayLike,
+    second_features: ArrayLike | None,
+    extra_mass_penalty: float,
+    distance: str | Callable[[np.ndarray, np.ndarray], np.ndarray],
+) -> tuple[float, np.ndarray]:
+    """Return the EMD and flow between two signatures."""
+    a = np.asarray(first_weights, dtype=np.float64)
+    b = np.asarray(second_weights, dtype=np.float64)
+    X = _as_features(first_features)
+    Y = X if second_features is None else _as_features(second_features)
+
+    _validate_signature_input(a, X, "First")
+    _validate_signature_input(b, Y, "Second")
+
+    M = _signature_cost_matrix(X, Y, distance)
+
+    if extra_mass_penalty == -1.0:
+        extra_mass_penalty = M.max()
+
+    sum_a = a.sum()
+    sum_b = b.sum()
+    extra_mass = abs(sum_a - sum_b)
+
+    # Edge case: one of the signatures is empty, so everything is extra mass
+    if sum_a == 0 or sum_b == 0:
+        return float(extra_mass * extra_mass_penalty), np.zeros(M.shape)
+
+    # Transport only between the two supports; the rest is extra mass
+    min_sum = min(sum_a, sum_b)
+    G = ot.partial.partial_wasserstein(a, b, M, m=min_sum)
+    transport_cost = np.sum(G * M)
+
+    return float(transport_cost + extra_mass * extra_mass_penalty), G
+
+
+def emd_signatures(
+    first_weights: ArrayLike,
+    first_features: ArrayLike,
+    second_weights: ArrayLike,
+    second_features: ArrayLike | None = None,
+    extra_mass_penalty: float = DEFAULT_EXTRA_MASS_PENALTY,
+    distance: str | Callable[[np.ndarray, np.ndarray], np.ndarray] = "euclidean",
+) -> float:
+    """Return the EMD between two signatures.
+
+    A signature is a set of clusters, each given by a weight and a feature
+    vector (Rubner et al., 2000). Unlike ``emd()``, the two signatures can have
+    different lengths and live on different supports: ground distances are only
+    computed between the clusters actually present, so the cost depends on the
+    signature sizes rather than on the size of a global bin vocabulary.
+
+    Arguments:
+        first_weights (ArrayLike): A 1D array of length N1 giving the mass of
+            each cluster in the first signature.
+        first_features (ArrayLike): An N1 × D array (or a 1D array of length
+            N1 when D = 1) giving the position of each cluster in the first
+            signature.
+        second_weights (ArrayLike): A 1D array of length N2 giving the mass of
+            each cluster in the second signature.
+
+    Keyword Arguments:
+        second_features (ArrayLike): An N2 × D array giving the position of
+            each cluster in the second signature. Defaults to
+            ``first_features``, in which case N1 must equal N2.
+        extra_mass_penalty (float): The penalty for extra mass. Same as for
+            ``emd()``; the default value of -1 means the maximum value in the
+            N1 × N2 ground distance matrix is used.
+        distance (string or function): The ground distance between features.
+            Either 'euclidean' (default) or a function that takes an N1 × D
+            and an N2 × D array and returns the N1 × N2 array of pairwise
+            distances. It must represent a metric; there is no warning if it
+            doesn't.
+
+    Returns:
+        float: The EMD value.
+
+    Raises:
+        ValueError: If either signature is empty, if the weights and features
+        of a signature don't match, if the features of the two signatures have
+        different dimensions, or if the distance function returns a matrix of
+        the wrong shape.
+    """
+    cost, _ = _emd_signatures(
+        first_weights,
+        first_features,
+        second_weights,
+        second_features,
+        extra_mass_penalty,
+        distance,
+    )
+    return cost
+
+
+def emd_signatures_with_flow(
+    first_weights: ArrayLike,
+    first_features: ArrayLike,
+    second_weights: ArrayLike,
+    second_features: ArrayLike | None = None,
+    extra_mass_penalty: float = DEFAULT_EXTRA_MASS_PENALTY,
+    distance: str | Callable[[np.ndarray, np.ndarray], np.ndarray] = "euclidean",
+) -> tuple[float, list[list[float]]]:
+    """Return the EMD and flow between two signatures.
+
+    See ``emd_signatures()`` for more information.
+
+    Returns:
+        (tuple(float, list(list(float)))): The EMD value and the associated
+        N1 × N2 minimum-cost flow between the clusters of the two signatures.
+    """
+    cost, flow = _emd_signatures(
+        first_weights,
+        first_features,
+        second_weights,
+        second_features,
+        extra_mass_penalty,
+        distance,
+    )
+    return cost, flow.tolist()
+
+
 def euclidean_pairwise_distance_matrix(x: np.ndarray) -> np.ndarray:
     """Calculate the Euclidean pairwise distance matrix for a 1D array."""
     distance_matrix = np.abs(np.repeat(x, len(x)) - np.tile(x, len(x)))
@@ -318,3 +933,124 @@ def emd_samples(
         )
     # Return the EMD
     return emd(first_histogram, second_histogram, distance_matrix, extra_mass_penalty)
+
+
+def _sliced_emd(
+    first_array: np.ndarray,
+    second_array: np.ndarray,
+    n_projections: int,
+    seed: int | np.random.Generator | None,
+) -> np.ndarray:
+    """Return the 1D EMD between the projected samples, one per projection.
+
+    With uniform weights, the 1D EMD is the integral of the absolute difference
+    between the quantile functions. Both quantile functions are piecewise
+    constant with breakpoints at multiples of 1/n1 and 1/n2, which are the same
+    for every projection, so all projections are handled at once.
+    """
+    n1 = first_array.shape[0]
+    n2 = second_array.shape[0]
+    rng = np.random.default_rng(seed)
+    directions = rng.standard_normal((first_array.shape[1], n_projections))
+    directions /= np.linalg.norm(directions, axis=0)
+
+    first_projected = np.sort(first_array @ directions, axis=0)
+    second_projected = np.sort(second_array @ directions, axis=0)
+
+    t = np.union1d(np.arange(1, n1 + 1) / n1, np.arange(1, n2 + 1) / n2)
+    dt = np.diff(t, prepend=0.0)
+    midpoints = t - dt / 2
+    first_idx = np.minimum((midpoints * n1).astype(int), n1 - 1)
+    second_idx = np.minimum((midpoints * n2).astype(int), n2 - 1)
+
+    difference = np.abs(first_projected[first_idx] - second_projected[second_idx])
+    return dt @ difference
+
+
+def emd_samples_nd(
+    first_array: ArrayLike,
+    second_array: ArrayLike,
+    extra_mass_penalty: float = DEFAULT_EXTRA_MASS_PENALTY,
+    normalized: bool = True,
+    method: str = "sliced",
+    n_projections: int = 50,
+    seed: int | np.random.Generator | None = None,
+) -> tuple[float, float]:
+    """Return the EMD between two sets of multi-dimensional samples.
+
+    Unlike ``emd_samples()``, the samples are not binned: each sample is a
+    point in D-dimensional space with Euclidean ground distance.
+
+    With ``method='sliced'`` (default), the samples are projected onto
+    ``n_projections`` random directions and the closed-form 1D EMDs are
+    averaged (the sliced Wasserstein distance). This costs O(n log n) per
+    projection and is a lower bound on the exact EMD, so it is meant for
+    ranking and scoring rather than for exact values. With ``method='exact'``,
+    the full transport problem between the samples is solved.
+
+    Arguments:
+        first_array (ArrayLike): An N1 × D array of samples (or a 1D array of
+            N1 scalar samples).
+        second_array (ArrayLike): An N2 × D array of samples.
+
+    Keyword Arguments:
+        extra_mass_penalty (float): The penalty for extra mass. Same as for
+            ``emd()``. Only used by the exact method when ``normalized`` is
+            false.
+        normalized (boolean): If true (default), treat each sample as a
+            fraction 1/N of its dataset. If false, treat each sample as unit
+            mass; the sliced method then requires N1 = N2.
+        method (string): Either 'sliced' (default) or 'exact'.
+        n_projections (int): The number of random directions used by the
+            sliced method.
+        seed (int or np.random.Generator): Seed for the random directions.
+
+    Returns:
+        (tuple(float, float)): The EMD estimate and the variance of that
+        estimate over the random projections (zero for the exact method).
+
+    Raises:
+        ValueError: If arrays are empty or have different dimensions, if the
+        method is unknown, or if the sliced method is used with
+        ``normalized=False`` and different numbers of samples.
+    """
+    first_array = _as_features(first_array)
+    second_array = _as_features(second_array)
+    if not (first_array.size > 0 and second_array.size > 0):
+        raise ValueError("Arrays of samples cannot be empty.")
+    if first_array.shape[1] != second_array.shape[1]:
+        raise ValueError("Samples must have the same dimension")
+    n1 = first_array.shape[0]
+    n2 = second_array.shape[0]
+
+    if method == "exact":
+        if normalized:
+            first_weights = np.full(n1, 1.0 / n1)
+            second_weights = np.full(n2, 1.0 / n2)
+        else:
+            first_weights = np.ones(n1)
+            second_weights = np.ones(n2)
+        value = emd_signatures(
+            first_weights,
+            first_array,
+            second_weights,
+            second_array,
+            extra_mass_penalty=extra_mass_penalty,
+        )
+        return value, 0.0
+
+    if method != "sliced":
+        raise ValueError(f"Unknown method: {method!r}")
+    if not normalized and n1 != n2:
+        raise ValueError(
+            "The sliced method requires the same number of samples in both "
+            "arrays when `normalized` is false."
+        )
+    if n_projections < 1:
+        raise ValueError("`n_projections` must be at least 1")
+
+    distances = _sliced_emd(first_array, second_array, n_projections, seed)
+    if not normalized:
+        distances = distances * n1
+    variance = distances.var(ddof=1) / n_projections if n_projections > 1 else 0.0
+    return float(distances.mean()), float(variance)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# test/test_main.py
+"""Tests for the ``python -m pyemd`` command-line tool"""
+
+import numpy as np
+import pytest
+
+from pyemd import emd, emd_samples
+from pyemd.__main__ import main
+
+
+HISTOGRAMS = np.array([[0.0, 1.0], [5.0, 3.0], [1.0, 1.0]])
+DISTANCE_MATRIX = np.array([[0.0, 0.5], [0.5, 0.0]])
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    np.save(tmp_path / "histograms.npy", HISTOGRAMS)
+    np.savez(tmp_path / "distance_matrix.npz", distance_matrix=DISTANCE_MATRIX)
+    return tmp_path
+
+
+def expected_pairwise(first, second):
+    return np.array([[emd(a, b, DISTANCE_MATRIX) for b in second] for a in first])
+
+
+def test_main_pairwise_npy(inputs):
+    output = inputs / "out.npy"
+    main(
+        [
+            "-d",
+            str(inputs / "distance_matrix.npz"),
+            str(inputs / "histograms.npy"),
+            "-o",
+            str(output),
+            "--chunk-size",
+            "2",
+        ]
+    )
+    assert np.allclose(np.load(output), expected_pairwise(HISTOGRAMS, HISTOGRAMS))
+
+
+def test_main_pairwise_workers(inputs):
+    output = inputs / "out.npy"
+    main(
+        [
+            "-d",
+            str(inputs / "distance_matrix.npz"),
+            str(inputs / "histograms.npy"),
+            "-o",
+            str(output),
+            "--workers",
+            "2",
+            "--chunk-size",
+            "2",
+        ]
+    )
+    assert np.allclose(np.load(output), expected_pairwise(HISTOGRAMS, HISTOGRAMS))
+
+
+def test_main_one_vs_many_csv(inputs):
+    np.savetxt(inputs / "query.csv", HISTOGRAMS[:1], delimiter=",")
+    output = inputs / "out.csv"
+    main(
+        [
+            "--mode",
+            "one-vs-many",
+            "-d",
+            str(inputs / "distance_matrix.npz"),
+            str(inputs / "query.csv"),
+            str(inputs / "histograms.npy"),
+            "-o",
+            str(output),
+        ]
+    )
+    result = np.genfromtxt(output, delimiter=",", names=True)
+    assert np.array_equal(result["first"], [0, 0, 0])
+    assert np.array_equal(result["second"], [0, 1, 2])
+    assert np.allclose(result["emd"], expected_pairwise(HISTOGRAMS[:1], HISTOGRAMS)[0])
+
+
+def test_main_paired_samples(inputs, capsys):
+    # Ragged rows are padded with empty fields
+    (inputs / "first.csv").write_text("1,2,3,4\n1,,,\n")
+    (inputs / "second.csv").write_text("2,3,4,5\n1,2,3,4\n")
+    main(
+        [
+            "--mode",
+            "paired",
+            "--samples",
+            "--bins",
+            "2",
+            str(inputs / "first.csv"),
+            str(inputs / "second.csv"),
+        ]
+    )
+    out, err = capsys.readouterr()
+    assert out.splitlines() == [
+        "first,second,emd",
+        f"0,0,{emd_samples([1, 2, 3, 4], [2, 3, 4, 5], bins=2)!r}",
+        f"1,1,{emd_samples([1], [1, 2, 3, 4], bins=2)!r}",
+    ]
+    assert "Computed 2 EMDs" in err
+
+
+def test_main_single_column_csv(inputs, capsys):
+    (inputs / "column.csv").write_text("1\n2\n3\n")
+    column = str(inputs / "column.csv")
+    main(["--mode", "paired", "--samples", column, column])
+    out, _ = capsys.readouterr()
+    assert out.splitlines()[1:] == ["0,0,0.0", "1,1,0.0", "2,2,0.0"]
+
+
+def test_main_npz_keys(inputs):
+    np.savez(inputs / "histograms.npz", histograms=HISTOGRAMS)
+    output = inputs / "out.npy"
+    main(
+        [
+            "-d",
+            str(inputs / "distance_matrix.npz"),
+            "--distance-matrix-key",
+            "distance_matrix",
+            "--key",
+            "histograms",
+            str(inputs / "histograms.npz"),
+            "-o",
+            str(output),
+        ]
+    )
+    assert np.allclose(np.load(output), expected_pairwise(HISTOGRAMS, HISTOGRAMS))
+
+
+# Validation
+
+
+def test_main_validate_distance_matrix_or_samples(inputs):
+    with pytest.raises(SystemExit):
+        main([str(inputs / "histograms.npy")])
+
+
+def test_main_validate_one_vs_many_single_row(inputs):
+    with pytest.raises(SystemExit):
+        main(
+            [
+                "--mode",
+                "one-vs-many",
+                "-d",
+                str(inputs / "distance_matrix.npz"),
+                str(inputs / "histograms.npy"),
+                str(inputs / "histograms.npy"),
+            ]
+        )
+
+
+def test_main_validate_paired_lengths(inputs):
+    np.save(inputs / "short.npy", HISTOGRAMS[:2])
+    with pytest.raises(SystemExit):
+        main(
+            [
+                "--mode",
+                "paired",
+                "-d",
+                str(inputs / "distance_matrix.npz"),
+                str(inputs / "histograms.npy"),
+                str(inputs / "short.npy"),
+            ]
+        )
+
+
+def test_main_validate_histogram_length(inputs):
+    np.save(inputs / "long.npy", np.ones((2, 3)))
+    with pytest.raises(SystemExit):
+        main(["-d", str(inputs / "distance_matrix.npz"), str(inputs / "long.npy")])
+
+
+def test_main_validate_2d_input(inputs):
+    np.save(inputs / "flat.npy", np.ones(3))
+    with pytest.raises(SystemExit):
+        main(["--samples", str(inputs / "flat.npy")])
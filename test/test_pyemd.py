@@ -3,10 +3,24 @@
 # test/test_pyemd.py
 """Tests for PyEMD"""
 
+import importlib
+
 import numpy as np
 import pytest
 
-from pyemd import emd, emd_samples, emd_with_flow
+from pyemd import (
+    distance_matrix_components,
+    emd,
+    emd_batch,
+    emd_below,
+    emd_dual_bound,
+    emd_samples,
+    emd_samples_nd,
+    emd_signatures,
+    emd_signatures_with_flow,
+    emd_with_flow,
+    emd_with_potentials,
+)
 
 
 EMD_PRECISION = 5
@@ -24,6 +38,12 @@ def emd_flow_assert(got, expected):
     assert np.array_equal(np.round(got_flow, FLOW_PRECISION), expected_flow)
 
 
+def euclidean_distance_matrix(points):
+    return np.sqrt(
+        np.sum((points[:, np.newaxis] - points[np.newaxis, :]) ** 2, axis=-1)
+    )
+
+
 # `emd()`
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
@@ -408,3 +428,434 @@ def test_emd_samples_validate_distance_matrix_size():
     second_array = [1, 2, 3, 4]
     with pytest.raises(ValueError):
         emd_samples(first_array, second_array, distance=dist)
+
+
+# `emd_signatures()`
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def test_emd_signatures_different_supports():
+    first_weights = [0.5, 0.5]
+    first_features = [[0.0, 0.0], [3.0, 4.0]]
+    second_weights = [1.0]
+    second_features = [[0.0, 0.0]]
+    emd_assert(
+        emd_signatures(first_weights, first_features, second_weights, second_features),
+        2.5,
+    )
+
+
+def test_emd_signatures_extra_mass_penalty():
+    first_weights = [1.0, 2.0]
+    first_features = [0.0, 1.0]
+    second_weights = [1.0]
+    second_features = [3.0]
+    emd_assert(
+        emd_signatures(
+            first_weights,
+            first_features,
+            second_weights,
+            second_features,
+            extra_mass_penalty=10.0,
+        ),
+        22.0,
+    )
+
+
+def test_emd_signatures_shared_features_matches_emd():
+    first_weights = np.array([1.0, 2.0, 1.0, 2.0])
+    second_weights = np.array([2.0, 1.0, 2.0, 1.0])
+    features = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+    distance_matrix = euclidean_distance_matrix(features)
+    emd_assert(
+        emd_signatures(first_weights, features, second_weights),
+        round(emd(first_weights, second_weights, distance_matrix), EMD_PRECISION),
+    )
+
+
+def test_emd_signatures_custom_distance():
+    def dist(x, y):
+        return np.abs(x - y.T)
+
+    emd_assert(emd_signatures([1.0], [1.0], [1.0, 1.0], [2.0, 4.0], distance=dist), 4.0)
+
+
+def test_emd_signatures_with_flow():
+    emd_flow_assert(
+        emd_signatures_with_flow([0.5, 0.5], [0.0, 1.0], [1.0], [2.0]),
+        (1.5, [[0.5], [0.5]]),
+    )
+
+
+# Validation
+
+
+def test_emd_signatures_validate_empty():
+    with pytest.raises(ValueError):
+        emd_signatures([], [], [1.0], [[5.0]])
+    with pytest.raises(ValueError):
+        emd_signatures([1.0], [[5.0]], [], np.empty((0, 1)))
+
+
+def test_emd_signatures_validate_weights_features_mismatch():
+    with pytest.raises(ValueError):
+        emd_signatures([1.0, 1.0], [[0.0]], [1.0], [[0.0]])
+
+
+def test_emd_signatures_validate_feature_dims():
+    with pytest.raises(ValueError):
+        emd_signatures([1.0], [[0.0, 1.0]], [1.0], [[0.0]])
+
+
+def test_emd_signatures_validate_custom_distance_shape():
+    def dist(x, y):
+        return np.zeros((len(x), len(x)))
+
+    with pytest.raises(ValueError):
+        emd_signatures([1.0], [0.0], [1.0, 1.0], [1.0, 2.0], distance=dist)
+
+
+# `emd_below()`
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def test_emd_below_matches_emd():
+    rng = np.random.default_rng(0)
+    distance_matrix = euclidean_distance_matrix(rng.random((8, 2)))
+    for _ in range(100):
+        first_histogram = rng.random(8)
+        second_histogram = rng.random(8)
+        value = emd(first_histogram, second_histogram, distance_matrix)
+        for max_distance in [
+            0.0,
+            0.5 * value,
+            np.nextafter(value, 0.0),
+            value,
+            np.nextafter(value, np.inf),
+            1.5 * value,
+        ]:
+            assert emd_below(
+                first_histogram, second_histogram, distance_matrix, max_distance
+            ) == (value <= max_distance)
+
+
+def test_emd_below_extra_mass_penalty():
+    first_signature = np.array([0.0, 2.0, 1.0, 2.0])
+    second_signature = np.array([2.0, 1.0, 2.0, 1.0])
+    distance_matrix = np.array(
+        [
+            [0.0, 1.0, 1.0, 2.0],
+            [1.0, 0.0, 2.0, 1.0],
+            [1.0, 2.0, 0.0, 1.0],
+            [2.0, 1.0, 1.0, 0.0],
+        ]
+    )
+    assert emd_below(
+        first_signature, second_signature, distance_matrix, 4.5, extra_mass_penalty=2.5
+    )
+    assert not emd_below(
+        first_signature, second_signature, distance_matrix, 4.4, extra_mass_penalty=2.5
+    )
+
+
+def test_emd_below_settled_by_bounds(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("solver should not be called")
+
+    monkeypatch.setattr("ot.partial.partial_wasserstein", fail)
+    first_signature = np.array([1.0, 0.0, 0.0])
+    second_signature = np.array([0.0, 0.5, 0.5])
+    distance_matrix = np.array([[0.0, 1.0, 2.0], [1.0, 0.0, 1.0], [2.0, 1.0, 0.0]])
+    # The EMD is 1.5; the lower bound is 1.5 and the feasible flow costs 1.5
+    assert emd_below(first_signature, second_signature, distance_matrix, 1.6)
+    assert not emd_below(first_signature, second_signature, distance_matrix, 1.4)
+
+
+def test_emd_below_far_pair_skips_upper_bound(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("only the lower bound should be computed")
+
+    emd_module = importlib.import_module("pyemd.emd")
+    monkeypatch.setattr(emd_module, "_transport_upper_bound", fail)
+    monkeypatch.setattr("ot.partial.partial_wasserstein", fail)
+    first_signature = np.array([1.0, 0.0, 0.0, 0.0])
+    second_signature = np.array([0.0, 0.0, 0.0, 1.0])
+    distance_matrix = np.abs(np.subtract.outer(np.arange(4.0), np.arange(4.0)))
+    assert not emd_below(first_signature, second_signature, distance_matrix, 1.0)
+
+
+def test_emd_below_validate_different_signature_dims():
+    first_signature = np.array([0.0, 1.0])
+    second_signature = np.array([5.0, 3.0, 3.0])
+    distance_matrix = np.array([[0.0, 0.5, 0.0], [0.5, 0.0, 0.0], [0.5, 0.0, 0.0]])
+    with pytest.raises(ValueError):
+        emd_below(first_signature, second_signature, distance_matrix, 1.0)
+
+
+# `distance_matrix_components()`
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+BLOCK_DISTANCE_MATRIX = np.array(
+    [
+        [0.0, 1.0, 5.0, 5.0, 5.0],
+        [1.0, 0.0, 5.0, 5.0, 5.0],
+        [5.0, 5.0, 0.0, 2.0, 5.0],
+        [5.0, 5.0, 2.0, 0.0, 5.0],
+        [5.0, 5.0, 5.0, 5.0, 0.0],
+    ]
+)
+
+
+def test_distance_matrix_components():
+    assert np.array_equal(
+        distance_matrix_components(BLOCK_DISTANCE_MATRIX), [0, 0, 1, 1, 2]
+    )
+
+
+def test_distance_matrix_components_chained():
+    distance_matrix = np.array([[0.0, 1.0, 3.0], [1.0, 0.0, 1.0], [3.0, 1.0, 0.0]])
+    assert np.array_equal(distance_matrix_components(distance_matrix), [0, 0, 0])
+
+
+def test_emd_with_components_matches_emd():
+    rng = np.random.default_rng(0)
+    components = distance_matrix_components(BLOCK_DISTANCE_MATRIX)
+    for extra_mass_penalty in [-1.0, 0.0, 2.5]:
+        for _ in range(10):
+            first_histogram = rng.random(5)
+            second_histogram = rng.random(5)
+            emd_assert(
+                emd(
+                    first_histogram,
+                    second_histogram,
+                    BLOCK_DISTANCE_MATRIX,
+                    extra_mass_penalty,
+                    components=components,
+                ),
+                round(
+                    emd(
+                        first_histogram,
+                        second_histogram,
+                        BLOCK_DISTANCE_MATRIX,
+                        extra_mass_penalty,
+                    ),
+                    EMD_PRECISION,
+                ),
+            )
+
+
+def test_emd_with_flow_with_components():
+    first_histogram = np.array([1.0, 0.0, 0.0, 1.0, 1.0])
+    second_histogram = np.array([0.0, 1.0, 2.0, 0.0, 0.0])
+    components = distance_matrix_components(BLOCK_DISTANCE_MATRIX)
+    emd_flow_assert(
+        emd_with_flow(
+            first_histogram,
+            second_histogram,
+            BLOCK_DISTANCE_MATRIX,
+            components=components,
+        ),
+        (
+            8.0,
+            [
+                [0.0, 1.0, 0.0, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0],
+                [0.0, 0.0, 1.0, 0.0, 0.0],
+                [0.0, 0.0, 1.0, 0.0, 0.0],
+            ],
+        ),
+    )
+
+
+def test_distance_matrix_components_validate_square():
+    with pytest.raises(ValueError):
+        distance_matrix_components(np.zeros((2, 3)))
+
+
+# `emd_samples_nd()`
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def test_emd_samples_nd_sliced_1d_is_exact():
+    first_array = [1.0, 2.0, 3.0, 4.0]
+    second_array = [2.0, 3.0, 4.0, 5.0, 6.0]
+    value, variance = emd_samples_nd(first_array, second_array, seed=0)
+    exact, _ = emd_samples_nd(first_array, second_array, method="exact")
+    emd_assert(value, round(exact, EMD_PRECISION))
+    emd_assert(variance, 0.0)
+
+
+def test_emd_samples_nd_sliced_lower_bound():
+    rng = np.random.default_rng(0)
+    first_array = rng.random((40, 3))
+    second_array = rng.random((30, 3)) + 0.5
+    value, variance = emd_samples_nd(first_array, second_array, seed=1)
+    exact, _ = emd_samples_nd(first_array, second_array, method="exact")
+    assert 0.0 < value <= exact
+    assert variance > 0.0
+
+
+def test_emd_samples_nd_seed():
+    rng = np.random.default_rng(0)
+    first_array = rng.random((20, 2))
+    second_array = rng.random((20, 2))
+    assert emd_samples_nd(first_array, second_array, seed=3) == emd_samples_nd(
+        first_array, second_array, seed=3
+    )
+
+
+def test_emd_samples_nd_not_normalized():
+    first_array = [[0.0, 0.0], [1.0, 0.0]]
+    second_array = [[0.0, 1.0], [1.0, 1.0]]
+    value, _ = emd_samples_nd(first_array, second_array, method="exact")
+    emd_assert(value, 1.0)
+    value, _ = emd_samples_nd(
+        first_array, second_array, normalized=False, method="exact"
+    )
+    emd_assert(value, 2.0)
+    normalized_value, _ = emd_samples_nd(first_array, second_array, seed=0)
+    value, _ = emd_samples_nd(first_array, second_array, normalized=False, seed=0)
+    emd_assert(value, round(2 * normalized_value, EMD_PRECISION))
+
+
+# Validation
+
+
+def test_emd_samples_nd_validate_empty():
+    with pytest.raises(ValueError):
+        emd_samples_nd([], [[1.0, 2.0]])
+
+
+def test_emd_samples_nd_validate_dimensions():
+    with pytest.raises(ValueError):
+        emd_samples_nd([[1.0, 2.0]], [[1.0, 2.0, 3.0]])
+
+
+def test_emd_samples_nd_validate_method():
+    with pytest.raises(ValueError):
+        emd_samples_nd([[1.0]], [[2.0]], method="unknown")
+
+
+def test_emd_samples_nd_validate_not_normalized_sliced():
+    with pytest.raises(ValueError):
+        emd_samples_nd([[1.0], [2.0]], [[2.0]], normalized=False)
+
+
+# `emd_batch()`
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def test_emd_batch_matches_emd():
+    rng = np.random.default_rng(0)
+    distance_matrix = euclidean_distance_matrix(rng.random((6, 2)))
+    first_histograms = rng.random((10, 6))
+    second_histograms = rng.random((10, 6))
+    # Fully cancelled pairs
+    second_histograms[0] = first_histograms[0]
+    second_histograms[1] = 2 * first_histograms[1]
+    for extra_mass_penalty in [-1.0, 0.0, 2.5]:
+        result = emd_batch(
+            first_histograms, second_histograms, distance_matrix, extra_mass_penalty
+        )
+        expected = [
+            emd(a, b, distance_matrix, extra_mass_penalty)
+            for a, b in zip(first_histograms, second_histograms)
+        ]
+        assert np.allclose(result, expected)
+
+
+def test_emd_batch_fully_cancelled_pairs_skip_solver(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("solver should not be called")
+
+    monkeypatch.setattr("ot.partial.partial_wasserstein", fail)
+    first_histograms = np.array([[1.0, 1.0], [1.0, 2.0]])
+    second_histograms = np.array([[1.0, 1.0], [3.0, 2.0]])
+    distance_matrix = np.array([[0.0, 1.0], [1.0, 0.0]])
+    assert np.array_equal(
+        emd_batch(first_histograms, second_histograms, distance_matrix), [0.0, 2.0]
+    )
+
+
+# Validation
+
+
+def test_emd_batch_validate_1d():
+    distance_matrix = np.array([[0.0, 0.5], [0.5, 0.0]])
+    with pytest.raises(ValueError):
+        emd_batch(np.array([0.0, 1.0]), np.array([5.0, 3.0]), distance_matrix)
+
+
+def test_emd_batch_validate_number_of_pairs():
+    distance_matrix = np.array([[0.0, 0.5], [0.5, 0.0]])
+    with pytest.raises(ValueError):
+        emd_batch(np.ones((2, 2)), np.ones((3, 2)), distance_matrix)
+
+
+def test_emd_batch_validate_larger_signatures():
+    distance_matrix = np.array([[0.0, 0.5], [0.5, 0.0]])
+    with pytest.raises(ValueError):
+        emd_batch(np.ones((2, 3)), np.ones((2, 3)), distance_matrix)
+
+
+# `emd_with_potentials()` and `emd_dual_bound()`
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def test_emd_with_potentials_1():
+    first_signature = np.array([0.0, 1.0])
+    second_signature = np.array([5.0, 3.0])
+    distance_matrix = np.array([[0.0, 0.5], [0.5, 0.0]])
+    value, flow, u, v = emd_with_potentials(
+        first_signature, second_signature, distance_matrix
+    )
+    emd_flow_assert((value, flow), (3.5, [[0.0, 0.0], [0.0, 1.0]]))
+    assert u.shape == v.shape == (3,)
+    emd_assert(emd_dual_bound(first_signature, second_signature, u, v), 3.5)
+
+
+def test_emd_with_potentials_extra_mass_penalty():
+    first_signature = np.array([0.0, 2.0, 1.0, 2.0])
+    second_signature = np.array([2.0, 1.0, 2.0, 1.0])
+    distance_matrix = np.array(
+        [
+            [0.0, 1.0, 1.0, 2.0],
+            [1.0, 0.0, 2.0, 1.0],
+            [1.0, 2.0, 0.0, 1.0],
+            [2.0, 1.0, 1.0, 0.0],
+        ]
+    )
+    value, _, u, v = emd_with_potentials(
+        first_signature, second_signature, distance_matrix, extra_mass_penalty=2.5
+    )
+    emd_assert(value, 4.5)
+    emd_assert(emd_dual_bound(first_signature, second_signature, u, v), 4.5)
+
+
+def test_emd_dual_bound_is_lower_bound():
+    rng = np.random.default_rng(0)
+    distance_matrix = euclidean_distance_matrix(rng.random((6, 2)))
+    _, _, u, v = emd_with_potentials(rng.random(6), rng.random(6), distance_matrix)
+    first_histograms = rng.random((20, 6))
+    second_histograms = rng.random((20, 6)) * 2
+    bounds = emd_dual_bound(first_histograms, second_histograms, u, v)
+    assert bounds.shape == (20,)
+    for a, b, bound in zip(first_histograms, second_histograms, bounds):
+        assert bound <= emd(a, b, distance_matrix) + 1e-9
+
+
+# Validation
+
+
+def test_emd_with_potentials_validate_different_signature_dims():
+    first_signature = np.array([0.0, 1.0])
+    second_signature = np.array([5.0, 3.0, 3.0])
+    distance_matrix = np.array([[0.0, 0.5, 0.0], [0.5, 0.0, 0.0], [0.5, 0.0, 0.0]])
+    with pytest.raises(ValueError):
+        emd_with_potentials(first_signature, second_signature, distance_matrix)
+
+
+def test_emd_dual_bound_validate_potential_length():
+    with pytest.raises(ValueError):
+        emd_dual_bound(np.ones(2), np.ones(2), np.zeros(2), np.zeros(2))